@@ -5,50 +5,134 @@ This module contains all AST node classes that represent the structure of
 Telugu/Tenglish programs and can generate equivalent Python code.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Union
+from typing import List, Optional, Any, Union, cast
 
+# Precomputed indentation strings; generated code never nests anywhere near
+# this deep, so _indent is a tuple index instead of a string multiply.
+_INDENT_CACHE = tuple("    " * i for i in range(64))
 
-class ASTNode(ABC):
+
+class ASTNode:
     """Base class for all AST nodes."""
 
-    @abstractmethod
+    __slots__ = ()
+
+    # Overridden by BinaryOperation; lets parenthesization checks read one
+    # class attribute instead of running isinstance per render.
+    _is_binop = False
+
+    # Overridden by the block-statement classes Program separates with a
+    # blank line, replacing a tuple-isinstance check per statement.
+    _needs_blank_line_after = False
+
     def to_python(self, indent_level: int = 0) -> str:
         """Generate Python code from this AST node."""
-        pass
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement to_python()"
+        )
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        """Append the code fragments for this node to a shared buffer.
+
+        Compound nodes override this to write directly into the buffer so
+        a full transpile builds one output list instead of one
+        intermediate string per node. The fallback delegates to
+        to_python() for nodes whose rendered form is a single string.
+        """
+        buf.append(self.to_python(indent_level))
 
     def accept(self, visitor):
         """Accept a visitor for traversal (visitor pattern)."""
-        method_name = f"visit_{self.__class__.__name__}"
-        visitor_method = getattr(visitor, method_name, visitor.generic_visit)
+        # Resolve visit_<ClassName> once per (visitor, node class) pair and
+        # cache it, so repeated visits skip the f-string + getattr lookup.
+        try:
+            dispatch = visitor._visit_dispatch
+        except AttributeError:
+            dispatch = visitor._visit_dispatch = {}
+
+        cls = type(self)
+        visitor_method = dispatch.get(cls)
+        if visitor_method is None:
+            visitor_method = getattr(
+                visitor, f"visit_{cls.__name__}", visitor.generic_visit
+            )
+            dispatch[cls] = visitor_method
         return visitor_method(self)
 
     def _indent(self, indent_level: int) -> str:
         """Generate indentation string."""
+        if indent_level < len(_INDENT_CACHE):
+            return _INDENT_CACHE[indent_level]
         return "    " * indent_level
 
     def __eq__(self, other) -> bool:
         """Default equality comparison."""
         if not isinstance(other, self.__class__):
             return False
-        return self.__dict__ == other.__dict__
+        return self._fields() == other._fields()
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        args = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        args = ", ".join(f"{k}={v!r}" for k, v in self._fields().items())
         return f"{self.__class__.__name__}({args})"
 
+    def _fields(self) -> dict:
+        """Node attributes that define identity (caches excluded)."""
+        fields = {}
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if not name.startswith("_"):
+                    fields[name] = getattr(self, name)
+        return fields
+
+
+# Operator precedence for parenthesization decisions
+# (higher number = higher precedence).
+_OP_PRECEDENCE = {
+    "or": 1,
+    "leda": 1,
+    "and": 2,
+    "mariyu": 2,
+    "not": 3,
+    "avvakapote": 3,
+    "==": 4,
+    "!=": 4,
+    "<": 4,
+    "<=": 4,
+    ">": 4,
+    ">=": 4,
+    "+": 5,
+    "-": 5,
+    "*": 6,
+    "/": 6,
+    "%": 6,
+}
+
+# Escapes backslashes and double quotes in a single pass over the string.
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+# Shared constants for the common empty leaf cases, so rendering them does
+# not go through the string formatter at all.
+_EMPTY_LIST_LITERAL = "[]"
+_EMPTY_PRINT = "print()\n"
+
 
 class Statement(ASTNode):
     """Base class for all statement nodes."""
 
-    pass
+    __slots__ = ()
+
+    def to_python(self, indent_level: int = 0) -> str:
+        """Render this statement by emitting into a fresh buffer."""
+        buf: List[str] = []
+        self.emit(buf, indent_level)
+        return "".join(buf).rstrip()
 
 
 class Expression(ASTNode):
     """Base class for all expression nodes."""
 
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -59,62 +143,72 @@ class Expression(ASTNode):
 class Program(ASTNode):
     """Root node representing a complete program."""
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[Statement]):
-        if not isinstance(statements, list):
-            raise TypeError("statements must be a list")
+        if __debug__:
+            if not isinstance(statements, list):
+                raise TypeError("statements must be a list")
         self.statements = statements
 
     def to_python(self, indent_level: int = 0) -> str:
         """Generate Python code for the entire program."""
-        if not self.statements:
-            return ""
+        buf: List[str] = []
+        self.emit(buf, indent_level)
+        return "".join(buf).rstrip()
 
-        python_lines = []
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        last = len(self.statements) - 1
         for i, stmt in enumerate(self.statements):
-            python_code = stmt.to_python(indent_level)
-            if python_code.strip():  # Only add non-empty lines
-                python_lines.append(python_code)
+            start = len(buf)
+            stmt.emit(buf, indent_level)
 
-                # Add blank line after certain statement types
-                if i < len(
-                    self.statements
-                ) - 1 and isinstance(  # Not the last statement
-                    stmt,
-                    (ForStatement, WhileStatement, IfStatement, FunctionDefinition),
-                ):
-                    python_lines.append("")  # Add blank line
+            # Only keep statements that produced non-empty code
+            if not any(fragment.strip() for fragment in buf[start:]):
+                del buf[start:]
+                continue
 
-        return "\n".join(python_lines)
+            # Add blank line after certain statement types
+            if i < last and stmt._needs_blank_line_after:
+                buf.append("\n")
 
 
 class ElifBlock(ASTNode):
     """Represents an elif block in conditional statements."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: Expression, body: List[Statement]):
-        if not isinstance(condition, Expression):
-            raise TypeError("condition must be an Expression")
-        if not isinstance(body, list):
-            raise TypeError("body must be a list")
+        if __debug__:
+            if not isinstance(condition, Expression):
+                raise TypeError("condition must be an Expression")
+            if not isinstance(body, list):
+                raise TypeError("body must be a list")
 
         self.condition = condition
         self.body = body
 
     def to_python(self, indent_level: int = 0) -> str:
         """Generate Python elif clause."""
-        condition_code = self.condition.to_python()
-        result = f"{self._indent(indent_level)}elif {condition_code}:\n"
+        buf: List[str] = []
+        self.emit(buf, indent_level)
+        return "".join(buf).rstrip()
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append("elif ")
+        self.condition.emit(buf)
+        buf.append(":\n")
 
         if self.body:
             for stmt in self.body:
-                result += stmt.to_python(indent_level + 1) + "\n"
+                stmt.emit(buf, indent_level + 1)
         else:
             # This should never happen since parser now validates non-empty blocks
             raise ValueError(
                 "For loop has empty body - this should be caught during parsing"
             )
 
-        return result.rstrip()
-
 
 # ============================================================================
 # LITERAL EXPRESSION NODES
@@ -124,9 +218,12 @@ class ElifBlock(ASTNode):
 class Identifier(Expression):
     """Represents a variable or function name."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
-        if not isinstance(name, str):
-            raise TypeError("name must be a string")
+        if __debug__:
+            if not isinstance(name, str):
+                raise TypeError("name must be a string")
         self.name = name
 
     def to_python(self, indent_level: int = 0) -> str:
@@ -136,56 +233,83 @@ class Identifier(Expression):
 class StringLiteral(Expression):
     """Represents a string literal."""
 
+    __slots__ = ("value", "_py")
+
     def __init__(self, value: str):
-        if not isinstance(value, str):
-            raise TypeError("value must be a string")
+        if __debug__:
+            if not isinstance(value, str):
+                raise TypeError("value must be a string")
         self.value = value
+        # Escape quotes properly; render once since the node is immutable
+        escaped = value.translate(_ESCAPE_TABLE)
+        self._py = f'"{escaped}"'
 
     def to_python(self, indent_level: int = 0) -> str:
-        # Escape quotes properly
-        escaped = self.value.replace("\\", "\\\\").replace('"', '\\"')
-        return f'"{escaped}"'
+        return self._py
 
 
 class NumberLiteral(Expression):
     """Represents a numeric literal."""
 
+    __slots__ = ("value", "_py")
+
     def __init__(self, value: Union[int, float]):
-        if not isinstance(value, (int, float)):
-            raise TypeError("value must be a number")
+        if __debug__:
+            if not isinstance(value, (int, float)):
+                raise TypeError("value must be a number")
         self.value = value
+        self._py = str(value)
 
     def to_python(self, indent_level: int = 0) -> str:
-        return str(self.value)
+        return self._py
 
 
 class BooleanLiteral(Expression):
     """Represents a boolean literal (Nijam/Abaddam → True/False)."""
 
+    __slots__ = ("value", "_py")
+
     def __init__(self, value: bool):
-        if not isinstance(value, bool):
-            raise TypeError("value must be a boolean")
+        if __debug__:
+            if not isinstance(value, bool):
+                raise TypeError("value must be a boolean")
         self.value = value
+        self._py = "True" if value else "False"
 
     def to_python(self, indent_level: int = 0) -> str:
-        return "True" if self.value else "False"
+        return self._py
 
 
 class ListLiteral(Expression):
     """Represents a list literal."""
 
+    __slots__ = ("elements",)
+
     def __init__(self, elements: List[Expression]):
-        if not isinstance(elements, list):
-            raise TypeError("elements must be a list")
+        if __debug__:
+            if not isinstance(elements, list):
+                raise TypeError("elements must be a list")
         self.elements = elements
 
     def to_python(self, indent_level: int = 0) -> str:
         if not self.elements:
-            return "[]"
+            return _EMPTY_LIST_LITERAL
 
         element_strings = [elem.to_python() for elem in self.elements]
         return "[" + ", ".join(element_strings) + "]"
 
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        if not self.elements:
+            buf.append(_EMPTY_LIST_LITERAL)
+            return
+
+        buf.append("[")
+        for i, elem in enumerate(self.elements):
+            if i:
+                buf.append(", ")
+            elem.emit(buf)
+        buf.append("]")
+
 
 # ============================================================================
 # OPERATION EXPRESSION NODES
@@ -195,39 +319,70 @@ class ListLiteral(Expression):
 class BinaryOperation(Expression):
     """Represents binary operations (arithmetic, comparison, logical)."""
 
+    __slots__ = ("left", "operator", "right", "_py")
+
+    _is_binop = True
+
     def __init__(self, left: Expression, operator: str, right: Expression):
-        if not isinstance(left, Expression):
-            raise TypeError("left operand must be an Expression")
-        if not isinstance(right, Expression):
-            raise TypeError("right operand must be an Expression")
-        if not isinstance(operator, str):
-            raise TypeError("operator must be a string")
+        if __debug__:
+            if not isinstance(left, Expression):
+                raise TypeError("left operand must be an Expression")
+            if not isinstance(right, Expression):
+                raise TypeError("right operand must be an Expression")
+            if not isinstance(operator, str):
+                raise TypeError("operator must be a string")
 
         self.left = left
         self.operator = operator
         self.right = right
+        self._py: Optional[str] = None
 
     def to_python(self, indent_level: int = 0) -> str:
+        # Expression nodes ignore indentation, so the rendered form can be
+        # memoized and reused when a parent re-renders the subtree.
+        if self._py is not None:
+            return self._py
+
         left_code = self.left.to_python()
         right_code = self.right.to_python()
 
         # Handle parentheses for complex expressions
-        if isinstance(self.left, BinaryOperation) and self._needs_parentheses(
-            self.left, True
-        ):
+        if self.left._is_binop and self._needs_parentheses(self.left, True):
             left_code = f"({left_code})"
-        if isinstance(self.right, BinaryOperation) and self._needs_parentheses(
-            self.right, False
-        ):
+        if self.right._is_binop and self._needs_parentheses(self.right, False):
             right_code = f"({right_code})"
 
         # Always use spaces around operators
-        return f"{left_code} {self.operator} {right_code}"
+        self._py = f"{left_code} {self.operator} {right_code}"
+        return self._py
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        if self._py is not None:
+            buf.append(self._py)
+            return
+
+        if self.left._is_binop and self._needs_parentheses(self.left, True):
+            buf.append("(")
+            self.left.emit(buf)
+            buf.append(")")
+        else:
+            self.left.emit(buf)
 
-    def _needs_parentheses(self, child: "BinaryOperation", is_left: bool) -> bool:
+        buf.append(f" {self.operator} ")
+
+        if self.right._is_binop and self._needs_parentheses(self.right, False):
+            buf.append("(")
+            self.right.emit(buf)
+            buf.append(")")
+        else:
+            self.right.emit(buf)
+
+    def _needs_parentheses(self, child: "Expression", is_left: bool) -> bool:
         """Determine if parentheses are needed based on operator precedence."""
         parent_precedence = self._get_precedence(self.operator)
-        child_precedence = self._get_precedence(child.operator)
+        # Every call site guards with _is_binop, so child is a
+        # BinaryOperation at runtime; the cast is for the type checker.
+        child_precedence = self._get_precedence(cast("BinaryOperation", child).operator)
 
         if child_precedence < parent_precedence:
             return True
@@ -238,72 +393,97 @@ class BinaryOperation(Expression):
 
     def _get_precedence(self, operator: str) -> int:
         """Get operator precedence (higher number = higher precedence)."""
-        precedence = {
-            "or": 1,
-            "leda": 1,
-            "and": 2,
-            "mariyu": 2,
-            "not": 3,
-            "avvakapote": 3,
-            "==": 4,
-            "!=": 4,
-            "<": 4,
-            "<=": 4,
-            ">": 4,
-            ">=": 4,
-            "+": 5,
-            "-": 5,
-            "*": 6,
-            "/": 6,
-            "%": 6,
-        }
-        return precedence.get(operator, 0)
+        return _OP_PRECEDENCE.get(operator, 0)
 
 
 class UnaryOperation(Expression):
     """Represents unary operations (not, -, +)."""
 
+    __slots__ = ("operator", "operand", "_py")
+
     def __init__(self, operator: str, operand: Expression):
-        if not isinstance(operand, Expression):
-            raise TypeError("operand must be an Expression")
-        if not isinstance(operator, str):
-            raise TypeError("operator must be a string")
+        if __debug__:
+            if not isinstance(operand, Expression):
+                raise TypeError("operand must be an Expression")
+            if not isinstance(operator, str):
+                raise TypeError("operator must be a string")
 
         self.operator = operator
         self.operand = operand
+        self._py: Optional[str] = None
 
     def to_python(self, indent_level: int = 0) -> str:
+        if self._py is not None:
+            return self._py
+
         operand_code = self.operand.to_python()
 
         # Add parentheses if operand is a complex expression
-        if isinstance(self.operand, BinaryOperation):
+        if self.operand._is_binop:
             operand_code = f"({operand_code})"
 
         # Handle spacing for different operators
         if self.operator in ["-", "+"]:
-            return f"{self.operator}{operand_code}"
+            self._py = f"{self.operator}{operand_code}"
         else:
-            return f"{self.operator} {operand_code}"
+            self._py = f"{self.operator} {operand_code}"
+        return self._py
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        if self._py is not None:
+            buf.append(self._py)
+            return
+
+        buf.append(
+            self.operator if self.operator in ["-", "+"] else f"{self.operator} "
+        )
+        if self.operand._is_binop:
+            buf.append("(")
+            self.operand.emit(buf)
+            buf.append(")")
+        else:
+            self.operand.emit(buf)
 
 
 class FunctionCall(Expression):
     """Represents a function call."""
 
+    __slots__ = ("name", "arguments", "_py")
+
     def __init__(self, name: str, arguments: List[Expression]):
-        if not isinstance(name, str):
-            raise TypeError("name must be a string")
-        if not isinstance(arguments, list):
-            raise TypeError("arguments must be a list")
+        if __debug__:
+            if not isinstance(name, str):
+                raise TypeError("name must be a string")
+            if not isinstance(arguments, list):
+                raise TypeError("arguments must be a list")
 
         self.name = name
         self.arguments = arguments
+        self._py: Optional[str] = None
 
     def to_python(self, indent_level: int = 0) -> str:
+        if self._py is not None:
+            return self._py
+
         if not self.arguments:
-            return f"{self.name}()"
+            self._py = f"{self.name}()"
+        else:
+            arg_strings = [arg.to_python() for arg in self.arguments]
+            self._py = f'{self.name}({", ".join(arg_strings)})'
+        return self._py
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        if self._py is not None:
+            buf.append(self._py)
+            return
 
-        arg_strings = [arg.to_python() for arg in self.arguments]
-        return f'{self.name}({", ".join(arg_strings)})'
+        buf.append(self.name)
+        buf.append("(")
+        for i, arg in enumerate(self.arguments):
+            if i:
+                buf.append(", ")
+            arg.emit(buf)
+        buf.append(")")
 
 
 # ============================================================================
@@ -314,41 +494,59 @@ class FunctionCall(Expression):
 class AssignmentStatement(Statement):
     """Represents variable assignment."""
 
+    __slots__ = ("variable", "value")
+
     def __init__(self, variable: str, value: Expression):
-        if not isinstance(variable, str):
-            raise TypeError("variable must be a string")
-        if not isinstance(value, Expression):
-            raise TypeError("value must be an Expression")
+        if __debug__:
+            if not isinstance(variable, str):
+                raise TypeError("variable must be a string")
+            if not isinstance(value, Expression):
+                raise TypeError("value must be an Expression")
 
         self.variable = variable
         self.value = value
 
-    def to_python(self, indent_level: int = 0) -> str:
-        value_code = self.value.to_python()
-        return f"{self._indent(indent_level)}{self.variable} = {value_code}"
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append(self.variable)
+        buf.append(" = ")
+        self.value.emit(buf)
+        buf.append("\n")
 
 
 class PrintStatement(Statement):
     """Represents Telugu postfix print: (args)cheppu → print(args)."""
 
+    __slots__ = ("arguments",)
+
     def __init__(self, arguments: List[Expression]):
-        if not isinstance(arguments, list):
-            raise TypeError("arguments must be a list")
+        if __debug__:
+            if not isinstance(arguments, list):
+                raise TypeError("arguments must be a list")
 
         self.arguments = arguments
 
-    def to_python(self, indent_level: int = 0) -> str:
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
         if not self.arguments:
-            return f"{self._indent(indent_level)}print()"
+            buf.append(_EMPTY_PRINT)
+            return
 
-        arg_strings = [arg.to_python() for arg in self.arguments]
-        args_code = ", ".join(arg_strings)
-        return f"{self._indent(indent_level)}print({args_code})"
+        buf.append("print(")
+        for i, arg in enumerate(self.arguments):
+            if i:
+                buf.append(", ")
+            arg.emit(buf)
+        buf.append(")\n")
 
 
 class IfStatement(Statement):
     """Represents conditional statements: okavela...aite → if."""
 
+    __slots__ = ("condition", "then_block", "else_block", "elif_blocks")
+
+    _needs_blank_line_after = True
+
     def __init__(
         self,
         condition: Expression,
@@ -356,24 +554,27 @@ class IfStatement(Statement):
         else_block: Optional[List[Statement]] = None,
         elif_blocks: Optional[List[ElifBlock]] = None,
     ):
-        if not isinstance(condition, Expression):
-            raise TypeError("condition must be an Expression")
-        if not isinstance(then_block, list):
-            raise TypeError("then_block must be a list")
+        if __debug__:
+            if not isinstance(condition, Expression):
+                raise TypeError("condition must be an Expression")
+            if not isinstance(then_block, list):
+                raise TypeError("then_block must be a list")
 
         self.condition = condition
         self.then_block = then_block
         self.else_block = else_block or []
         self.elif_blocks = elif_blocks or []
 
-    def to_python(self, indent_level: int = 0) -> str:
-        condition_code = self.condition.to_python()
-        result = f"{self._indent(indent_level)}if {condition_code}:\n"
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append("if ")
+        self.condition.emit(buf)
+        buf.append(":\n")
 
         # Then block
         if self.then_block:
             for stmt in self.then_block:
-                result += stmt.to_python(indent_level + 1) + "\n"
+                stmt.emit(buf, indent_level + 1)
         else:
             # This should never happen since parser now validates non-empty blocks
             raise ValueError(
@@ -382,153 +583,180 @@ class IfStatement(Statement):
 
         # Elif blocks
         for elif_block in self.elif_blocks:
-            result += elif_block.to_python(indent_level) + "\n"
+            elif_block.emit(buf, indent_level)
 
         # Else block
         if self.else_block:
-            result += f"{self._indent(indent_level)}else:\n"
+            buf.append(self._indent(indent_level))
+            buf.append("else:\n")
             for stmt in self.else_block:
-                result += stmt.to_python(indent_level + 1) + "\n"
-
-        return result.rstrip()
+                stmt.emit(buf, indent_level + 1)
 
 
 class ForStatement(Statement):
     """Represents Telugu for loops: iterable lo var ki → for var in iterable."""
 
+    __slots__ = ("variable", "iterable", "body")
+
+    _needs_blank_line_after = True
+
     def __init__(self, variable: str, iterable: Expression, body: List[Statement]):
-        if not isinstance(variable, str):
-            raise TypeError("variable must be a string")
-        if not isinstance(iterable, Expression):
-            raise TypeError("iterable must be an Expression")
-        if not isinstance(body, list):
-            raise TypeError("body must be a list")
+        if __debug__:
+            if not isinstance(variable, str):
+                raise TypeError("variable must be a string")
+            if not isinstance(iterable, Expression):
+                raise TypeError("iterable must be an Expression")
+            if not isinstance(body, list):
+                raise TypeError("body must be a list")
 
         self.variable = variable
         self.iterable = iterable
         self.body = body
 
-    def to_python(self, indent_level: int = 0) -> str:
-        iterable_code = self.iterable.to_python()
-        result = (
-            f"{self._indent(indent_level)}for {self.variable} in {iterable_code}:\n"
-        )
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append(f"for {self.variable} in ")
+        self.iterable.emit(buf)
+        buf.append(":\n")
 
         if self.body:
             for stmt in self.body:
-                result += stmt.to_python(indent_level + 1) + "\n"
+                stmt.emit(buf, indent_level + 1)
         else:
             # This should never happen since parser now validates non-empty blocks
             raise ValueError(
                 "For loop has empty body - this should be caught during parsing"
             )
 
-        return result.rstrip()
-
 
 class WhileStatement(Statement):
     """Represents Telugu while loops: condition unnanta varaku → while condition."""
 
+    __slots__ = ("condition", "body")
+
+    _needs_blank_line_after = True
+
     def __init__(self, condition: Expression, body: List[Statement]):
-        if not isinstance(condition, Expression):
-            raise TypeError("condition must be an Expression")
-        if not isinstance(body, list):
-            raise TypeError("body must be a list")
+        if __debug__:
+            if not isinstance(condition, Expression):
+                raise TypeError("condition must be an Expression")
+            if not isinstance(body, list):
+                raise TypeError("body must be a list")
 
         self.condition = condition
         self.body = body
 
-    def to_python(self, indent_level: int = 0) -> str:
-        condition_code = self.condition.to_python()
-        result = f"{self._indent(indent_level)}while {condition_code}:\n"
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append("while ")
+        self.condition.emit(buf)
+        buf.append(":\n")
 
         if self.body:
             for stmt in self.body:
-                result += stmt.to_python(indent_level + 1) + "\n"
+                stmt.emit(buf, indent_level + 1)
         else:
             # This should never happen since parser now validates non-empty blocks
             raise ValueError(
                 "While loop has empty body - this should be caught during parsing"
             )
 
-        return result.rstrip()
-
 
 class FunctionDefinition(Statement):
     """Represents Telugu function definition: vidhanam name(params) → def name(params)."""
 
+    __slots__ = ("name", "parameters", "body")
+
+    _needs_blank_line_after = True
+
     def __init__(self, name: str, parameters: List[str], body: List[Statement]):
-        if not isinstance(name, str):
-            raise TypeError("name must be a string")
-        if not isinstance(parameters, list):
-            raise TypeError("parameters must be a list")
-        if not isinstance(body, list):
-            raise TypeError("body must be a list")
+        if __debug__:
+            if not isinstance(name, str):
+                raise TypeError("name must be a string")
+            if not isinstance(parameters, list):
+                raise TypeError("parameters must be a list")
+            if not isinstance(body, list):
+                raise TypeError("body must be a list")
 
         self.name = name
         self.parameters = parameters
         self.body = body
 
-    def to_python(self, indent_level: int = 0) -> str:
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
         params_code = ", ".join(self.parameters)
-        result = f"{self._indent(indent_level)}def {self.name}({params_code}):\n"
+        buf.append(self._indent(indent_level))
+        buf.append(f"def {self.name}({params_code}):\n")
 
         if self.body:
             for stmt in self.body:
-                result += stmt.to_python(indent_level + 1) + "\n"
+                stmt.emit(buf, indent_level + 1)
         else:
             # This should never happen since parser now validates non-empty blocks
             raise ValueError(
                 "Function has empty body - this should be caught during parsing"
             )
 
-        return result.rstrip()
-
 
 class ReturnStatement(Statement):
     """Represents Telugu return: value ivvu → return value."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Optional[Expression] = None):
         self.value = value
 
-    def to_python(self, indent_level: int = 0) -> str:
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
         if self.value is None:
-            return f"{self._indent(indent_level)}return"
-
-        value_code = self.value.to_python()
-        return f"{self._indent(indent_level)}return {value_code}"
+            buf.append("return\n")
+        else:
+            buf.append("return ")
+            self.value.emit(buf)
+            buf.append("\n")
 
 
 class BreakStatement(Statement):
     """Represents Telugu break: aagipo → break."""
 
-    def to_python(self, indent_level: int = 0) -> str:
-        return f"{self._indent(indent_level)}break"
+    __slots__ = ()
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append("break\n")
 
 
 class ContinueStatement(Statement):
     """Represents Telugu continue: munduku vellu → continue."""
 
-    def to_python(self, indent_level: int = 0) -> str:
-        return f"{self._indent(indent_level)}continue"
+    __slots__ = ()
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        buf.append("continue\n")
 
 
 class ExpressionStatement(Statement):
     """Represents a statement that consists of a single expression."""
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Expression):
         self.expression = expression
 
     def __repr__(self):
         return f"ExpressionStatement(expr={repr(self.expression)})"
 
-    def to_python(self, indent_level: int = 0) -> str:
-        return f"{self._indent(indent_level)}{self.expression.to_python()}"
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        buf.append(self._indent(indent_level))
+        self.expression.emit(buf)
+        buf.append("\n")
 
 
 class MethodCall(Expression):
     """Represents method calls like object.method(args)."""
 
+    __slots__ = ("object_expr", "method_name", "arguments")
+
     def __init__(
         self, object_expr: Expression, method_name: str, arguments: list[Expression]
     ):
@@ -545,10 +773,21 @@ class MethodCall(Expression):
         args_code = ", ".join(arg.to_python() for arg in self.arguments)
         return f"{object_code}.{self.method_name}({args_code})"
 
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        self.object_expr.emit(buf)
+        buf.append(f".{self.method_name}(")
+        for i, arg in enumerate(self.arguments):
+            if i:
+                buf.append(", ")
+            arg.emit(buf)
+        buf.append(")")
+
 
 class AttributeAccess(Expression):
     """Represents attribute access like object.attribute."""
 
+    __slots__ = ("object_expr", "attribute_name")
+
     def __init__(self, object_expr: Expression, attribute_name: str):
         self.object_expr = object_expr
         self.attribute_name = attribute_name
@@ -559,3 +798,7 @@ class AttributeAccess(Expression):
     def to_python(self, indent_level: int = 0) -> str:
         object_code = self.object_expr.to_python()
         return f"{object_code}.{self.attribute_name}"
+
+    def emit(self, buf: List[str], indent_level: int = 0) -> None:
+        self.object_expr.emit(buf)
+        buf.append(f".{self.attribute_name}")
@@ -6,10 +6,17 @@ This lexer handles:
 - Postfix print syntax: (args)cheppu
 - Special Telugu syntax patterns
 - Mixed language support (Telugu keywords + English identifiers)
+
+The scanner is a single compiled master regex with one named group per
+token class, iterated with finditer(). Compared to the earlier PLY-based
+lexer this removes the per-token Python function call: each match is
+classified by m.lastgroup and handled inline.
 """
 
+import functools
+import logging
 import re
-import ply.lex as lex
+import sys
 
 try:
     from .keywords import (
@@ -29,17 +36,142 @@ except ImportError:
     SPECIAL_PATTERNS = kw_module.SPECIAL_PATTERNS
     UNCHANGED_FUNCTIONS = kw_module.UNCHANGED_FUNCTIONS
 
+# Compiled once instead of going through the re module cache on every
+# multi-word keyword match.
+_WS_RE = re.compile(r"\s+")
+
+logger = logging.getLogger(__name__)
+
+# Intern keyword strings so the per-token dict probes hash pointer-equal keys.
+SINGLE_WORD_KEYWORDS = {
+    sys.intern(k): sys.intern(v) if v else v for k, v in SINGLE_WORD_KEYWORDS.items()
+}
+MULTI_WORD_KEYWORDS = {
+    sys.intern(k): sys.intern(v) for k, v in MULTI_WORD_KEYWORDS.items()
+}
+ALL_KEYWORDS = {
+    sys.intern(k): sys.intern(v) if v else v for k, v in ALL_KEYWORDS.items()
+}
+
+# Final token values for single-word keywords, resolved once so the
+# identifier branch is a single dict probe. Keywords with no Python spelling
+# (e.g. 'ki') keep their Telugu form for the parser; 'aite' is consumed
+# during parsing and carries an empty value.
+_SINGLE_KEYWORD_VALUES = {k: v or k for k, v in SINGLE_WORD_KEYWORDS.items()}
+_SINGLE_KEYWORD_VALUES["aite"] = ""
+
+# Integer ids per token type; parser hot paths dispatch on these instead
+# of comparing type strings.
+TOKEN_TYPE_ID = {
+    name: i
+    for i, name in enumerate(
+        (
+            "NUMBER",
+            "STRING",
+            "IDENTIFIER",
+            "TELUGU_KEYWORD",
+            "PLUS",
+            "MINUS",
+            "TIMES",
+            "DIVIDE",
+            "MODULO",
+            "EQUALS",
+            "LT",
+            "LE",
+            "GT",
+            "GE",
+            "NE",
+            "ASSIGN",
+            "IN",
+            "LPAREN",
+            "RPAREN",
+            "LBRACKET",
+            "RBRACKET",
+            "LBRACE",
+            "RBRACE",
+            "COMMA",
+            "DOT",
+            "COLON",
+            "NEWLINE",
+        )
+    )
+}
+
+# Paren tracking as one table probe instead of two string compares.
+_PAREN_DELTA = {"LPAREN": 1, "RPAREN": -1}
+
+# Master scanner: one named group per token class. Order matters — the
+# multi-word keywords must come before IDENTIFIER, and two-character
+# operators before their one-character prefixes. SKIP swallows inline
+# whitespace and MISMATCH catches anything else so errors are reported
+# instead of silently dropped.
+_MASTER = re.compile(
+    r"""
+    (?P<NEWLINE>\n+)
+  | (?P<SKIP>[\ \t]+)
+  | (?P<MULTIWORD>munduku\s+vellu|unnanta\s+varaku|lekapothe\s+okavela)
+  | (?P<IDENTIFIER>[a-zA-Z_][a-zA-Z_0-9]*)
+  | (?P<NUMBER>\d+)
+  | (?P<STRING>"(?:[^\\\n]|\\.)*?")
+  | (?P<EQUALS>==)
+  | (?P<LE><=)
+  | (?P<GE>>=)
+  | (?P<NE>!=)
+  | (?P<ASSIGN>=)
+  | (?P<LT><)
+  | (?P<GT>>)
+  | (?P<PLUS>\+)
+  | (?P<MINUS>-)
+  | (?P<TIMES>\*)
+  | (?P<DIVIDE>/)
+  | (?P<MODULO>%)
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<LBRACKET>\[)
+  | (?P<RBRACKET>\])
+  | (?P<LBRACE>\{)
+  | (?P<RBRACE>\})
+  | (?P<COMMA>,)
+  | (?P<DOT>\.)
+  | (?P<COLON>:)
+  | (?P<MISMATCH>.)
+    """,
+    re.VERBOSE,
+)
+
+
+class Token:
+    """A lexed token with the attributes the parser relies on."""
+
+    __slots__ = ("type", "value", "lineno", "lexpos", "tid")
+
+    def __init__(self, type, value, lineno, lexpos):
+        # Interned so parser-side equality checks against literal type
+        # names short-circuit on pointer identity. (Keyword values are
+        # already interned in the keyword tables.)
+        self.type = sys.intern(type)
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        # Small integer tag so hot parser loops compare ints, not strings
+        self.tid = TOKEN_TYPE_ID[type]
+
+    def __repr__(self):
+        return f"Token({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
 
 class TengLexer:
-    """Telugu/Tenglish lexer using PLY."""
+    """Telugu/Tenglish lexer built on a single master regex."""
 
-    # Token definitions
+    __slots__ = ("lineno", "paren_count")
+
+    # Token names produced by the scanner (kept for reference/debugging).
     tokens = (
         # Literals
         "NUMBER",
         "STRING",
         "IDENTIFIER",
-        # Telugu keywords (will be added dynamically)
+        # Telugu keywords
         "TELUGU_KEYWORD",
         # Operators
         "PLUS",
@@ -67,155 +199,68 @@ class TengLexer:
         "COLON",
         # Special
         "NEWLINE",
-        "CHEPPU",  # Special token for print
     )
 
-    # Token rules
-    t_PLUS = r"\+"
-    t_MINUS = r"-"
-    t_TIMES = r"\*"
-    t_DIVIDE = r"/"
-    t_MODULO = r"%"
-    t_EQUALS = r"=="
-    t_LT = r"<"
-    t_LE = r"<="
-    t_GT = r">"
-    t_GE = r">="
-    t_NE = r"!="
-    t_ASSIGN = r"="
-    t_LPAREN = r"\("
-    t_RPAREN = r"\)"
-    t_LBRACKET = r"\["
-    t_RBRACKET = r"\]"
-    t_LBRACE = r"\{"
-    t_RBRACE = r"\}"
-    t_COMMA = r","
-    t_DOT = r"\."
-    t_COLON = r":"
-
-    # Ignored characters (spaces and tabs)
-    t_ignore = " \t"
-
     def __init__(self):
-        self.lexer = None
-        self.indent_stack = [0]  # Track indentation levels
-        self.at_line_start = True
+        self.lineno = 1
         self.paren_count = 0
 
     def build(self, **kwargs):
-        """Build the lexer."""
-        self.lexer = lex.lex(module=self, **kwargs)
-        return self.lexer
-
-    def t_NUMBER(self, t):
-        r"\d+"
-        t.value = int(t.value)
-        return t
-
-    def t_STRING(self, t):
-        r"\"([^\\\n]|(\\.))*?\" "
-        t.value = t.value[1:-1]  # Remove quotes
-        return t
-
-    def t_CHEPPU(self, t):
-        r"cheppu"
-        """Handle cheppu (print) keyword"""
-        t.value = "print"
-        t.type = "TELUGU_KEYWORD"
-        return t
-
-    def t_MULTIWORD_KEYWORD(self, t):
-        r"(munduku\s+vellu|unnanta\s+varaku|lekapothe\s+okavela)"
-        """Handle multi-word Telugu keywords."""
-        # Normalize whitespace
-        normalized = re.sub(r"\s+", " ", t.value.strip())
-        if normalized in MULTI_WORD_KEYWORDS:
-            t.value = MULTI_WORD_KEYWORDS[normalized]
-            t.type = "TELUGU_KEYWORD"
-        return t
-
-    def t_FOR_LOOP_PATTERN(self, t):
-        r"\w+\s+lo\s+\w+\s+ki"
-        """Handle for loop pattern: iterable lo var ki"""
-        parts = t.value.split()
-        if len(parts) == 4 and parts[1] == "lo" and parts[3] == "ki":
-            iterable, _, var, _ = parts
-            t.value = f"for {var} in {iterable}"
-            t.type = "TELUGU_KEYWORD"
-        return t
-
-    def t_OKAVELA(self, t):
-        r"okavela"
-        """Handle okavela keyword"""
-        t.value = "if"
-        t.type = "TELUGU_KEYWORD"
-        return t
-
-    def t_AITE(self, t):
-        r"aite"
-        """Handle aite keyword"""
-        t.value = ""  # This becomes part of the if syntax, consumed during parsing
-        t.type = "TELUGU_KEYWORD"
-        return t
-
-    def t_IDENTIFIER(self, t):
-        r"[a-zA-Z_][a-zA-Z_0-9]*"
-        """Handle identifiers and single-word keywords."""
-
-        # Check if it's a Telugu keyword
-        if t.value in SINGLE_WORD_KEYWORDS:
-            python_kw = SINGLE_WORD_KEYWORDS[t.value]
-            if python_kw:  # Some keywords map to empty string
-                t.value = python_kw
-            t.type = "TELUGU_KEYWORD"
-        elif t.value == "in":
-            # Handle Python 'in' operator
-            t.type = "IN"
-        else:
-            # Regular identifier
-            t.type = "IDENTIFIER"
-
-        return t
-
-    def t_NEWLINE(self, t):
-        r"\n+"
-        t.lexer.lineno += len(t.value)
-        self.at_line_start = True
-
-        # Only return newline tokens when not inside parentheses
-        if self.paren_count == 0:
-            return t
-
-    def t_error(self, t):
-        """Handle lexing errors."""
-        print(f"Illegal character '{t.value[0]}' at line {t.lineno}")
-        t.lexer.skip(1)
-
-    def track_parentheses(self, t):
-        """Track parentheses for proper newline handling."""
-        if t.type == "LPAREN":
-            self.paren_count += 1
-        elif t.type == "RPAREN":
-            self.paren_count -= 1
+        """Kept for API compatibility; the master regex is compiled at import."""
+        return self
+
+    def iter_tokens(self, text):
+        """Yield tokens lazily from input text."""
+        # Hot loop: keep the counters and lookups in locals; the attribute
+        # state is written back once on exit.
+        lineno = 1
+        paren_count = 0
+        keyword_values = _SINGLE_KEYWORD_VALUES
+        multi_word = MULTI_WORD_KEYWORDS
+
+        for m in _MASTER.finditer(text):
+            kind = m.lastgroup
+            value = m.group()
+
+            if kind == "SKIP":
+                continue
+            elif kind == "IDENTIFIER":
+                keyword_value = keyword_values.get(value)
+                if keyword_value is not None:
+                    kind = "TELUGU_KEYWORD"
+                    value = keyword_value
+                elif value == "in":
+                    kind = "IN"
+            elif kind == "NEWLINE":
+                token = Token(kind, value, lineno, m.start())
+                lineno += len(value)
+                # Only emit newline tokens when not inside parentheses
+                if paren_count == 0:
+                    yield token
+                continue
+            elif kind == "NUMBER":
+                value = int(value)
+            elif kind == "STRING":
+                value = value[1:-1]  # Remove quotes
+            elif kind == "MULTIWORD":
+                kind = "TELUGU_KEYWORD"
+                value = multi_word[_WS_RE.sub(" ", value)]
+            elif kind in _PAREN_DELTA:
+                paren_count += _PAREN_DELTA[kind]
+            elif kind == "MISMATCH":
+                # Lazy %-formatting: nothing is built unless a handler
+                # at ERROR level is actually listening
+                logger.error("Illegal character %r at line %d", value, lineno)
+                continue
+
+            yield Token(kind, value, lineno, m.start())
+
+        self.lineno = lineno
+        self.paren_count = paren_count
 
     def tokenize(self, text):
-        """Tokenize input text."""
-        if not self.lexer:
-            self.build()
-
-        self.lexer.input(text)
-        tokens = []
-
-        while True:
-            tok = self.lexer.token()
-            if not tok:
-                break
-
-            # Track parentheses
-            self.track_parentheses(tok)
-            tokens.append(tok)
-
-        return tokens
+        """Tokenize input text into a list (see iter_tokens for streaming)."""
+        return list(self.iter_tokens(text))
 
     def test_lexer(self, text):
         """Test the lexer with input text."""
@@ -230,8 +275,13 @@ class TengLexer:
 
 
 # Convenience function
+@functools.lru_cache(maxsize=1)
 def create_lexer():
-    """Create and return a new TengLexer instance."""
+    """Return a shared TengLexer instance.
+
+    tokenize() resets all per-run state, so one instance can be reused
+    across calls; caching here means repeat callers skip construction.
+    """
     lexer = TengLexer()
     lexer.build()
     return lexer
@@ -5,14 +5,20 @@ Command-line interface for transpiling Telugu/Tenglish code to Python.
 """
 
 import argparse
+import hashlib
+import importlib.util
+import marshal
 import sys
 import os
+import tempfile
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from transpiler import TengTranspiler
+try:
+    from .transpiler import TengTranspiler
+except ImportError:
+    # Fallback for direct execution - the script directory is already
+    # sys.path[0], so no sys.path manipulation is needed
+    from transpiler import TengTranspiler
 
 
 def main():
@@ -44,6 +50,11 @@ Examples:
     parser.add_argument(
         "--debug", action="store_true", help="Show debug information during execution"
     )
+    parser.add_argument(
+        "--numba",
+        action="store_true",
+        help="Decorate purely numeric functions with @njit (requires numba)",
+    )
     parser.add_argument(
         "--args",
         help='Arguments to pass to the Tenglish program (e.g., --args "arg1 arg2")',
@@ -52,7 +63,7 @@ Examples:
     args = parser.parse_args()
 
     # Initialize transpiler
-    transpiler = TengTranspiler()
+    transpiler = TengTranspiler(numba_mode=args.numba)
 
     try:
         # Get Telugu code
@@ -64,8 +75,14 @@ Examples:
         if args.debug:
             print(f"Input Telugu code:\n{telugu_code}\n", file=sys.stderr)
 
-        # Transpile to Python
-        python_code = transpiler.transpile(telugu_code)
+        # Reuse a cached transpile of identical source when available
+        cache_file = _cache_path(telugu_code, args.numba)
+        python_code = _read_cache(cache_file)
+
+        if python_code is None:
+            # Transpile to Python
+            python_code = transpiler.transpile(telugu_code)
+            _write_cache(cache_file, python_code)
 
         if args.debug:
             print(f"Generated Python code:\n{python_code}\n", file=sys.stderr)
@@ -86,6 +103,10 @@ Examples:
         if args.debug:
             print("Executing Tenglish code:", file=sys.stderr)
 
+        # Compile once (reusing a marshalled code object when cached) so
+        # exec() does not re-run the Python frontend over the string
+        code_obj = _load_code_object(cache_file, python_code, args.input_file)
+
         # Set up sys.argv for the Tenglish program
         original_argv = sys.argv[:]
         try:
@@ -96,7 +117,7 @@ Examples:
             else:
                 sys.argv = [args.input_file or "<string>"]
 
-            exec(python_code)
+            exec(code_obj, {"__name__": "__main__"})
         finally:
             # Restore original sys.argv
             sys.argv = original_argv
@@ -112,20 +133,102 @@ Examples:
         sys.exit(1)
 
 
+def _transpiler_stamp():
+    """Digest of the transpiler's own sources, for cache keying.
+
+    Mixing this into the cache key invalidates cached output when the
+    transpiler itself changes - the analog of the interpreter magic
+    number guarding the marshalled code objects.
+    """
+    hasher = hashlib.sha256()
+    pkg_dir = Path(__file__).resolve().parent
+    for name in (
+        "keywords.py",
+        "lexer.py",
+        "parser.py",
+        "ast_nodes.py",
+        "transpiler.py",
+    ):
+        try:
+            hasher.update((pkg_dir / name).read_bytes())
+        except OSError:
+            hasher.update(name.encode("utf-8"))
+    return hasher.digest()
+
+
+_TRANSPILER_STAMP = _transpiler_stamp()
+
+
+def _cache_path(telugu_code, numba_mode):
+    """Cache location for a given source text (and transpile options)."""
+    hasher = hashlib.sha256(telugu_code.encode("utf-8"))
+    hasher.update(_TRANSPILER_STAMP)
+    if numba_mode:
+        hasher.update(b"numba")
+    return Path.home() / ".cache" / "brahmic" / f"{hasher.hexdigest()}.py"
+
+
+def _load_code_object(cache_file, python_code, input_file):
+    """Compile the generated Python, reusing a marshalled code object.
+
+    The blob lives next to the source cache with CPython's magic number
+    prefixed, so a cached entry from a different interpreter version is
+    recompiled rather than loaded.
+    """
+    blob_file = cache_file.with_suffix(".marshal")
+    magic = importlib.util.MAGIC_NUMBER
+    try:
+        blob = blob_file.read_bytes()
+        if blob[: len(magic)] == magic:
+            return marshal.loads(blob[len(magic) :])
+    except (OSError, ValueError, EOFError):
+        pass
+
+    code_obj = compile(python_code, input_file or "<string>", "exec")
+    try:
+        blob_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=blob_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(magic)
+            f.write(marshal.dumps(code_obj))
+        os.replace(tmp_name, blob_file)
+    except (OSError, ValueError):
+        pass
+    return code_obj
+
+
+def _read_cache(cache_file):
+    """Return cached Python code, or None on a miss."""
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_cache(cache_file, python_code):
+    """Store transpiled code, writing atomically so readers never see a
+    partial file. Cache failures are ignored - they only cost a re-transpile."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(python_code)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        pass
+
+
 def read_file(filename):
     """Read Telugu source file."""
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            return f.read()
-    except UnicodeDecodeError:
-        # Try different encodings
-        for encoding in ["utf-8", "latin-1", "cp1252"]:
-            try:
-                with open(filename, "r", encoding=encoding) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
-        raise ValueError(f"Unable to read file {filename} with any supported encoding")
+    # Read the bytes once and try decodings in memory instead of
+    # re-reading the file for each candidate encoding.
+    data = Path(filename).read_bytes()
+    for encoding in ["utf-8-sig", "utf-8", "latin-1", "cp1252"]:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"Unable to read file {filename} with any supported encoding")
 
 
 def write_file(filename, content):
@@ -5,10 +5,10 @@ This parser takes a more direct approach, working with the tokens from
 the existing lexer to build AST nodes.
 """
 
-from typing import List, Optional, Any, Iterator
+import sys
 
 try:
-    from .lexer import TengLexer
+    from .lexer import TengLexer, TOKEN_TYPE_ID
     from .ast_nodes import (
         Program,
         Statement,
@@ -37,7 +37,7 @@ try:
     )
 except ImportError:
     # Fallback for direct execution
-    from lexer import TengLexer
+    from lexer import TengLexer, TOKEN_TYPE_ID
     from ast_nodes import (
         Program,
         Statement,
@@ -66,33 +66,82 @@ except ImportError:
     )
 
 
+# Tags used by the classification pre-scan; int compares instead of
+# string compares on the hottest loop.
+_TID_NEWLINE = TOKEN_TYPE_ID["NEWLINE"]
+_TID_LPAREN = TOKEN_TYPE_ID["LPAREN"]
+_TID_RPAREN = TOKEN_TYPE_ID["RPAREN"]
+_TID_TELUGU_KEYWORD = TOKEN_TYPE_ID["TELUGU_KEYWORD"]
+_TID_IDENTIFIER = TOKEN_TYPE_ID["IDENTIFIER"]
+_TID_COLON = TOKEN_TYPE_ID["COLON"]
+
+# Keyword values are interned when the lexer builds its tables, so the
+# pre-scan can compare by identity instead of string equality.
+_KW_RETURN = sys.intern("return")
+_KW_IN = sys.intern("in")
+_KW_WHILE = sys.intern("while")
+_KW_PRINT = sys.intern("print")
+
+
+# Binding powers for the table-driven binary-expression parser; higher
+# binds tighter. Keyword operators (leda/mariyu) are looked up by value.
+_BINOP_PRECEDENCE = {
+    "EQUALS": 3,
+    "NE": 3,
+    "LT": 4,
+    "LE": 4,
+    "GT": 4,
+    "GE": 4,
+    "IN": 4,
+    "PLUS": 5,
+    "MINUS": 5,
+    "TIMES": 6,
+    "DIVIDE": 6,
+    "MODULO": 6,
+}
+_KEYWORD_PRECEDENCE = {"or": 1, "and": 2}
+
+# Flyweight leaf nodes: booleans, small ints and repeated identifiers
+# are immutable once built, so identical literals across a program share
+# one AST object instead of allocating per occurrence. The identifier
+# cache is capped so pathological inputs cannot grow it without bound.
+_TRUE = BooleanLiteral(True)
+_FALSE = BooleanLiteral(False)
+_NUM_CACHE = {n: NumberLiteral(n) for n in range(256)}
+_IDENT_CACHE = {}
+_IDENT_CACHE_MAX = 4096
+
+
 class TokenStream:
     """Helper class to manage token stream for parsing."""
 
     def __init__(self, tokens):
         self.tokens = tokens
         self.pos = 0
+        # Cached once; the token list never changes after construction
+        self._n = len(tokens)
 
     def peek(self, offset=0):
         """Look ahead at token without consuming it."""
         pos = self.pos + offset
-        if pos < len(self.tokens):
+        if pos < self._n:
             return self.tokens[pos]
         return None
 
     def consume(self):
         """Consume and return current token."""
-        if self.pos < len(self.tokens):
-            token = self.tokens[self.pos]
-            self.pos += 1
+        pos = self.pos
+        if pos < self._n:
+            token = self.tokens[pos]
+            self.pos = pos + 1
             return token
         return None
 
     def match(self, *token_types):
         """Check if current token matches any of the given types."""
-        current = self.peek()
-        if current and current.type in token_types:
-            return True
+        pos = self.pos
+        if pos < self._n:
+            return self.tokens[pos].type in token_types
         return False
 
     def expect(self, token_type):
@@ -106,7 +155,16 @@ class TokenStream:
 
     def at_end(self):
         """Check if we're at the end of tokens."""
-        return self.pos >= len(self.tokens)
+        return self.pos >= self._n
+
+    def skip_newlines(self):
+        """Advance past any NEWLINE tokens in one tight loop."""
+        tokens = self.tokens
+        pos = self.pos
+        n = self._n
+        while pos < n and tokens[pos].tid == _TID_NEWLINE:
+            pos += 1
+        self.pos = pos
 
 
 class TengParser:
@@ -115,46 +173,147 @@ class TengParser:
     def __init__(self):
         self.lexer = TengLexer()
         self.lexer.build()
+        self._stmt_kinds = {}
+        self._pred_cache = {}
+        self.source_lines = []
+        self.line_indents = []
+        # True once parse() has stored source lines for indent analysis
+        self._has_line_info = False
 
     def parse(self, input_text):
         """Parse Telugu code and return AST."""
         # Store source for indentation analysis
         self.source_lines = input_text.split("\n")
+        # Indent per source line, computed once so block-boundary checks
+        # are a list index instead of re-scanning the same prefix
+        self.line_indents = [
+            self._calculate_line_indent(line) for line in self.source_lines
+        ]
+        self._has_line_info = True
         self.tokens = self.lexer.tokenize(input_text)
 
         # Filter out None tokens and debug
         self.tokens = [t for t in self.tokens if t is not None]
 
+        # Tag each logical line's statement kind in one linear pass so
+        # _parse_statement does a dict lookup instead of re-running the
+        # lookahead predicates per statement
+        self._classify_statements()
+        self._pred_cache = {}
+
         stream = TokenStream(self.tokens)
         statements = self._parse_program(stream)
         return Program(statements)
 
+    def _classify_statements(self):
+        """Pre-scan the token list and tag the statement kind per line.
+
+        Walks the tokens once, classifying each logical line the same way
+        the _is_telugu_* lookahead predicates would, and stores the result
+        keyed by the line's starting token index.
+        """
+        kinds = {}
+        tokens = self.tokens
+        n = len(tokens)
+        pos = 0
+        while pos < n:
+            if tokens[pos].tid == _TID_NEWLINE:
+                pos += 1
+                continue
+            kind, line_end = self._classify_line(tokens, pos, n)
+            kinds[pos] = kind
+            pos = line_end
+        self._stmt_kinds = kinds
+
+    def _classify_line(self, tokens, start, n):
+        """Classify one logical line; returns (kind, end_position).
+
+        kind is one of "return", "print", "for", "while", "incomplete_for",
+        or None for lines handled by the assignment/expression fallback.
+        The priority order mirrors the predicate order _parse_statement
+        used to check.
+        """
+        depth = 0
+        found_return = False
+        is_print = False
+        print_checked = tokens[start].tid != _TID_LPAREN
+        for_kind = None  # None until the first top-level 'in' decides
+        found_while = False
+
+        i = start
+        while i < n:
+            token = tokens[i]
+            tid = token.tid
+            if tid == _TID_NEWLINE:
+                break
+
+            if tid == _TID_LPAREN:
+                depth += 1
+            elif tid == _TID_RPAREN:
+                depth -= 1
+                if depth == 0 and not print_checked:
+                    print_checked = True
+                    nxt = tokens[i + 1] if i + 1 < n else None
+                    is_print = (
+                        nxt is not None
+                        and nxt.tid == _TID_TELUGU_KEYWORD
+                        and nxt.value is _KW_PRINT
+                    )
+            elif tid == _TID_TELUGU_KEYWORD:
+                value = token.value
+                if value is _KW_RETURN:
+                    found_return = True
+                elif value is _KW_IN and depth == 0 and for_kind is None:
+                    # 'lo' maps to 'in'; the first top-level one decides
+                    var_token = tokens[i + 1] if i + 1 < n else None
+                    ki_token = tokens[i + 2] if i + 2 < n else None
+                    colon_token = tokens[i + 3] if i + 3 < n else None
+                    if var_token and var_token.tid == _TID_IDENTIFIER:
+                        if (
+                            ki_token
+                            and ki_token.tid == _TID_TELUGU_KEYWORD
+                            and colon_token
+                            and colon_token.tid == _TID_COLON
+                        ):
+                            for_kind = "for"
+                        else:
+                            for_kind = "incomplete_for"
+                    else:
+                        for_kind = "no"
+                elif value is _KW_WHILE:
+                    nxt = tokens[i + 1] if i + 1 < n else None
+                    if nxt and nxt.tid == _TID_COLON:
+                        found_while = True
+            i += 1
+
+        if found_return:
+            return "return", i
+        if is_print:
+            return "print", i
+        if for_kind == "for":
+            return "for", i
+        if found_while:
+            return "while", i
+        if for_kind == "incomplete_for":
+            return "incomplete_for", i
+        return None, i
+
     def _get_line_indent(self, line_num):
         """Get indentation level of a source line."""
-        if line_num >= len(self.source_lines):
+        if line_num >= len(self.line_indents):
             return 0
 
-        line = self.source_lines[line_num]
-        indent = 0
-        for char in line:
-            if char == " ":
-                indent += 1
-            elif char == "\t":
-                indent += 8
-            else:
-                break
-        return indent
+        return self.line_indents[line_num]
 
     def _parse_indented_block(self, stream, base_indent=0):
         """Parse an indented block of statements using proper indentation analysis."""
         statements = []
 
         # Skip any immediate newlines
-        while stream.match("NEWLINE"):
-            stream.consume()
+        stream.skip_newlines()
 
-        # If we don't have source lines or token line info, fall back to simple parsing
-        if not hasattr(self, "source_lines") or not hasattr(stream.peek(), "lineno"):
+        # If we don't have source line info, fall back to simple parsing
+        if not self._has_line_info or stream.at_end():
             return self._parse_simple_block(stream)
 
         # Parse statements while they remain at the expected indentation level
@@ -182,15 +341,13 @@ class TengParser:
                 break
 
             # Get the line number and check indentation
-            if hasattr(current_token, "lineno"):
-                line_num = current_token.lineno - 1  # Convert to 0-based
-                if line_num < len(self.source_lines):
-                    line_text = self.source_lines[line_num]
-                    current_indent = self._calculate_line_indent(line_text)
+            line_num = current_token.lineno - 1  # Convert to 0-based
+            if line_num < len(self.line_indents):
+                current_indent = self.line_indents[line_num]
 
-                    # If current line is back to base indentation or less, end the block
-                    if current_indent <= base_indent:
-                        break
+                # If current line is back to base indentation or less, end the block
+                if current_indent <= base_indent:
+                    break
 
             # Parse the statement
             stmt = self._parse_statement(stream)
@@ -232,15 +389,10 @@ class TengParser:
 
     def _calculate_line_indent(self, line):
         """Calculate the indentation level of a line."""
-        indent = 0
-        for char in line:
-            if char == " ":
-                indent += 1
-            elif char == "\t":
-                indent += 8
-            else:
-                break
-        return indent
+        # Measure the leading whitespace run with C-level str methods
+        # instead of a per-character Python loop (tabs count as 8).
+        prefix = line[: len(line) - len(line.lstrip(" \t"))]
+        return len(prefix) + 7 * prefix.count("\t")
 
     def _parse_program(self, stream):
         """Parse a complete program."""
@@ -324,6 +476,10 @@ class TengParser:
             if not token:
                 break
 
+            if token.type == "NEWLINE":
+                # Don't look across lines
+                break
+
             if token.type == "LPAREN":
                 depth += 1
             elif token.type == "RPAREN":
@@ -386,6 +542,10 @@ class TengParser:
             if not token:
                 break
 
+            if token.type == "NEWLINE":
+                # Don't look across lines
+                break
+
             if token.type == "LPAREN":
                 depth += 1
             elif token.type == "RPAREN":
@@ -422,17 +582,21 @@ class TengParser:
         # Handle direct token types first (most reliable)
         if current.type == "TELUGU_KEYWORD":
             return self._parse_telugu_statement(stream)
-        elif current.type == "CHEPPU":
-            return self._parse_print_statement(stream)
 
-        # Then check for Telugu patterns that span multiple tokens
-        elif self._is_telugu_return_statement(stream):
+        # Then check the pre-scanned classification for patterns that
+        # span multiple tokens (falling back to the lookahead predicates
+        # when entered at a position the pre-scan did not see)
+        kind = self._stmt_kinds.get(stream.pos, False)
+        if kind is False:
+            kind = self._classify_kind_slow(stream)
+
+        if kind == "return":
             return self._parse_telugu_return_statement(stream)
-        elif self._is_telugu_postfix_print(stream):
+        elif kind == "print":
             return self._parse_telugu_postfix_print(stream)
-        elif self._is_telugu_for_loop(stream):
+        elif kind == "for":
             return self._parse_telugu_for_loop(stream)
-        elif self._is_telugu_while_loop(stream):
+        elif kind == "while":
             return self._parse_telugu_while_loop(stream)
 
         # Handle remaining simple statement types
@@ -449,51 +613,40 @@ class TengParser:
                 # Telugu return statement: value ivvu
                 return self._parse_telugu_return_statement(stream)
             else:
-                # Check for incomplete for loop patterns before falling back to expression
-                if self._is_incomplete_for_loop(stream):
+                if kind == "incomplete_for":
                     raise SyntaxError("Incomplete for loop: missing 'ki' or ':'")
                 # Function call or other expression
                 return self._parse_expression_statement(stream)
-        elif current.type == "TELUGU_KEYWORD":
-            return self._parse_telugu_statement(stream)
         else:
             # Try to parse as expression
             return self._parse_expression_statement(stream)
 
-    def _parse_print_statement(self, stream):
-        """Parse Telugu print statement: (args)cheppu"""
-        cheppu_token = stream.expect("CHEPPU")
-
-        # Extract arguments from the print syntax
-        # The lexer already converted (args)cheppu to print(args)
-        print_call = cheppu_token.value  # This should be "print(...)"
-
-        # Parse arguments from print(args)
-        if print_call.startswith("print(") and print_call.endswith(")"):
-            args_str = print_call[6:-1]  # Remove print( and )
-
-            if not args_str.strip():
-                return PrintStatement([])
-
-            # Simple argument parsing (this could be more sophisticated)
-            arguments = []
-
-            # Split by comma but handle quotes
-            parts = self._split_arguments(args_str)
-            for part in parts:
-                part = part.strip()
-                if part.startswith('"') and part.endswith('"'):
-                    arguments.append(StringLiteral(part[1:-1]))
-                elif part.isdigit():
-                    arguments.append(NumberLiteral(int(part)))
-                elif part.replace(".", "").isdigit():
-                    arguments.append(NumberLiteral(float(part)))
-                else:
-                    arguments.append(Identifier(part))
-
-            return PrintStatement(arguments)
-
-        return PrintStatement([])
+    def _classify_kind_slow(self, stream):
+        """Classify via the lookahead predicates (pre-scan cache miss).
+
+        Results are memoized by stream position - the predicates are pure
+        functions of (tokens, pos), so re-entry at the same position
+        returns the cached kind.
+        """
+        key = stream.pos
+        if key in self._pred_cache:
+            return self._pred_cache[key]
+        kind = self._run_predicates(stream)
+        self._pred_cache[key] = kind
+        return kind
+
+    def _run_predicates(self, stream):
+        if self._is_telugu_return_statement(stream):
+            return "return"
+        if self._is_telugu_postfix_print(stream):
+            return "print"
+        if self._is_telugu_for_loop(stream):
+            return "for"
+        if self._is_telugu_while_loop(stream):
+            return "while"
+        if self._is_incomplete_for_loop(stream):
+            return "incomplete_for"
+        return None
 
     def _parse_telugu_for_loop(self, stream):
         """Parse Telugu for loop: iterable lo var ki:"""
@@ -530,7 +683,11 @@ class TengParser:
     def _parse_telugu_while_loop(self, stream):
         """Parse Telugu while loop: condition unnanta varaku:"""
         # Parse the condition expression (everything before 'while' keyword)
-        condition = self._parse_expression_until_while(stream)
+        # The expression parser stops naturally at the 'while' keyword
+        # (it is not an operator), so the condition parses in place
+        if stream.match("TELUGU_KEYWORD") and stream.peek().value == "while":
+            raise SyntaxError("Missing condition in while loop")
+        condition = self._parse_expression(stream)
 
         # Expect 'unnanta varaku' (mapped to 'while')
         while_token = stream.expect("TELUGU_KEYWORD")
@@ -598,46 +755,6 @@ class TengParser:
 
         return PrintStatement(arguments)
 
-    def _parse_expression_until_while(self, stream):
-        """Parse expression tokens until we hit the 'while' keyword."""
-        # Collect tokens until we see TELUGU_KEYWORD('while')
-        tokens = []
-        while not stream.at_end():
-            current = stream.peek()
-            if current.type == "TELUGU_KEYWORD" and current.value == "while":
-                break
-            tokens.append(stream.consume())
-
-        # Create a sub-stream and parse the expression
-        if not tokens:
-            raise SyntaxError("Missing condition in while loop")
-
-        # Create temporary stream with just the condition tokens
-        temp_stream = TokenStream(tokens)
-        return self._parse_expression(temp_stream)
-
-    def _split_arguments(self, args_str):
-        """Split function arguments, respecting quotes."""
-        parts = []
-        current = ""
-        in_quotes = False
-
-        for char in args_str:
-            if char == '"' and (not current or current[-1] != "\\"):
-                in_quotes = not in_quotes
-            elif char == "," and not in_quotes:
-                if current.strip():
-                    parts.append(current.strip())
-                current = ""
-                continue
-
-            current += char
-
-        if current.strip():
-            parts.append(current.strip())
-
-        return parts
-
     def _parse_assignment(self, stream):
         """Parse assignment statement: var = expr"""
         var_token = stream.expect("IDENTIFIER")
@@ -645,28 +762,30 @@ class TengParser:
         value = self._parse_expression(stream)
         return AssignmentStatement(var_token.value, value)
 
+    # Statement keyword -> handler, resolved at class-body time so
+    # _parse_telugu_statement does one dict probe instead of a chain of
+    # string compares. Values are unbound functions called as f(self, stream).
+    _TELUGU_DISPATCH = {
+        "if": lambda self, stream: self._parse_if_statement(stream),  # okavela
+        "def": lambda self, stream: self._parse_function_definition(stream),  # vidhanam
+        "return": lambda self, stream: self._parse_return_statement(stream),  # ivvu
+        "break": lambda self, stream: BreakStatement(),  # aagipo
+        "continue": lambda self, stream: ContinueStatement(),  # munduku vellu
+    }
+
     def _parse_telugu_statement(self, stream):
         """Parse Telugu-specific statements."""
         keyword_token = stream.consume()
         keyword_value = keyword_token.value
 
-        if keyword_value == "if":  # okavela -> if
-            return self._parse_if_statement(stream)
-        elif keyword_value == "def":  # vidhanam -> def
-            return self._parse_function_definition(stream)
-        elif keyword_value == "return":  # ivvu -> return
-            return self._parse_return_statement(stream)
-        elif keyword_value == "break":  # aagipo -> break
-            return BreakStatement()
-        elif keyword_value == "continue":  # munduku vellu -> continue
-            return ContinueStatement()
-        elif keyword_value.startswith(
-            "for "
-        ):  # Preprocessed for loop: "for var in iterable"
+        handler = self._TELUGU_DISPATCH.get(keyword_value)
+        if handler is not None:
+            return handler(self, stream)
+        if keyword_value.startswith("for "):
+            # Preprocessed for loop: "for var in iterable"
             return self._parse_preprocessed_for_loop(stream, keyword_value)
-        else:
-            # Handle other cases or return None
-            return None
+        # Handle other cases or return None
+        return None
 
     def _parse_if_statement(self, stream):
         """Parse if statement: okavela condition aite: or okavela condition avvakapote:"""
@@ -696,8 +815,11 @@ class TengParser:
         elif_blocks = []
         else_block = []
 
-        while stream.match("TELUGU_KEYWORD"):
+        while True:
+            # One peek decides both the type check and the value switch
             next_token = stream.peek()
+            if next_token is None or next_token.type != "TELUGU_KEYWORD":
+                break
             if next_token.value == "elif":  # lekapothe okavela (converted by lexer)
                 stream.consume()  # consume elif
                 elif_condition = self._parse_expression(stream)
@@ -801,14 +923,13 @@ class TengParser:
         if not parent_token:
             parent_token = stream.peek()
 
-        if not parent_token or not hasattr(parent_token, "lineno"):
+        if not parent_token:
             return 0
 
         # Get the indentation of the parent line
         line_num = parent_token.lineno - 1  # Convert to 0-based
-        if hasattr(self, "source_lines") and line_num < len(self.source_lines):
-            line_text = self.source_lines[line_num]
-            return self._calculate_line_indent(line_text)
+        if line_num < len(self.line_indents):
+            return self.line_indents[line_num]
 
         return 0
 
@@ -819,100 +940,68 @@ class TengParser:
 
     def _parse_expression(self, stream):
         """Parse an expression."""
-        return self._parse_logical_or(stream)
+        return self._parse_binary(stream, 1)
 
-    def _parse_logical_or(self, stream):
-        """Parse logical OR expression."""
-        expr = self._parse_logical_and(stream)
+    def _parse_binary(self, stream, min_prec, _BinOp=BinaryOperation):
+        """Precedence-climbing parse of binary operator chains.
 
-        while stream.match("TELUGU_KEYWORD"):
-            op_token = stream.peek()
-            if op_token.value == "or":  # leda -> or
-                stream.consume()
-                right = self._parse_logical_and(stream)
-                expr = BinaryOperation(expr, "or", right)
-            else:
-                break
-
-        return expr
+        One loop with a binding-power table replaces the or/and/equality/
+        comparison/addition/multiplication cascade, so an atomic operand
+        costs one call instead of six. The node constructor is bound as a
+        default argument so building each operator node is a LOAD_FAST
+        rather than a global lookup.
+        """
+        expr = self._parse_unary(stream)
 
-    def _parse_logical_and(self, stream):
-        """Parse logical AND expression."""
-        expr = self._parse_equality(stream)
+        while True:
+            token = stream.peek()
+            if token is None:
+                return expr
+            if token.type == "TELUGU_KEYWORD":
+                prec = _KEYWORD_PRECEDENCE.get(token.value)
+            else:
+                prec = _BINOP_PRECEDENCE.get(token.type)
+            if prec is None or prec < min_prec:
+                return expr
 
-        while stream.match("TELUGU_KEYWORD"):
-            op_token = stream.peek()
-            if op_token.value == "and":  # mariyu -> and
-                stream.consume()
-                right = self._parse_equality(stream)
-                expr = BinaryOperation(expr, "and", right)
+            stream.consume()
+            right = self._parse_binary(stream, prec + 1)
+            expr = _BinOp(expr, token.value, right)
+
+    def _parse_unary(self, stream, _UnaryOp=UnaryOperation):
+        """Parse unary expressions.
+
+        Prefix operators are collected iteratively and folded around the
+        primary from the inside out, so a run of prefixes costs one frame
+        instead of one recursive call each (and cannot hit the recursion
+        limit on adversarial input).
+        """
+        # Inlined peek + type compare instead of vararg match(): this
+        # runs once per operand, so the per-call tuple build adds up
+        ops = None
+        while True:
+            token = stream.peek()
+            if token is None:
+                break
+            token_type = token.type
+            if token_type == "MINUS" or token_type == "PLUS":
+                op = token.value
+            elif token_type == "TELUGU_KEYWORD" and token.value == "not":
+                # Telugu NOT (avvakapote)
+                op = "not"
             else:
                 break
-
-        return expr
-
-    def _parse_equality(self, stream):
-        """Parse equality expressions."""
-        expr = self._parse_comparison(stream)
-
-        while stream.match("EQUALS", "NE"):
-            op_token = stream.consume()
-            right = self._parse_comparison(stream)
-            expr = BinaryOperation(expr, op_token.value, right)
-
-        return expr
-
-    def _parse_comparison(self, stream):
-        """Parse comparison expressions."""
-        expr = self._parse_addition(stream)
-
-        while stream.match("LT", "LE", "GT", "GE", "IN"):
-            op_token = stream.consume()
-            right = self._parse_addition(stream)
-            expr = BinaryOperation(expr, op_token.value, right)
-
-        return expr
-
-    def _parse_addition(self, stream):
-        """Parse addition/subtraction."""
-        expr = self._parse_multiplication(stream)
-
-        while stream.match("PLUS", "MINUS"):
-            op_token = stream.consume()
-            right = self._parse_multiplication(stream)
-            expr = BinaryOperation(expr, op_token.value, right)
-
-        return expr
-
-    def _parse_multiplication(self, stream):
-        """Parse multiplication/division."""
-        expr = self._parse_unary(stream)
-
-        while stream.match("TIMES", "DIVIDE", "MODULO"):
-            op_token = stream.consume()
-            right = self._parse_unary(stream)
-            expr = BinaryOperation(expr, op_token.value, right)
-
-        return expr
-
-    def _parse_unary(self, stream):
-        """Parse unary expressions."""
-        if stream.match("MINUS", "PLUS"):
-            op_token = stream.consume()
-            expr = self._parse_unary(stream)
-            return UnaryOperation(op_token.value, expr)
-        elif stream.match("TELUGU_KEYWORD"):
-            # Handle Telugu NOT (avvakapote)
-            op_token = stream.peek()
-            if op_token.value == "not":
-                stream.consume()
-                expr = self._parse_unary(stream)
-                return UnaryOperation("not", expr)
+            stream.consume()
+            if ops is None:
+                ops = [op]
             else:
-                # Not a unary operator, parse as primary
-                return self._parse_primary(stream)
+                ops.append(op)
 
-        return self._parse_primary(stream)
+        expr = self._parse_primary(stream)
+        if ops is not None:
+            for op in reversed(ops):
+                expr = _UnaryOp(op, expr)
+        return expr
 
     def _parse_primary(self, stream):
         """Parse primary expressions (literals, identifiers, etc.)."""
@@ -920,48 +1009,39 @@ class TengParser:
         if not current:
             raise SyntaxError("Unexpected end of input")
 
-        if current.type == "NUMBER":
-            stream.consume()
-            return NumberLiteral(current.value)
-
-        elif current.type == "STRING":
-            stream.consume()
-            return StringLiteral(current.value)
-
-        elif current.type == "IDENTIFIER":
-            stream.consume()
-            expr = Identifier(current.value)
-
-            # Handle dot notation and function calls in a loop
-            while True:
-                if stream.match("DOT"):
-                    # Handle method call: object.method(args)
-                    stream.consume()  # consume .
-                    method_token = stream.expect("IDENTIFIER")
-                    method_name = method_token.value
-
-                    if stream.match("LPAREN"):
-                        # Method call with arguments
-                        stream.consume()  # consume (
-
-                        arguments = []
-                        while not stream.match("RPAREN"):
-                            arg = self._parse_expression(stream)
-                            arguments.append(arg)
-
-                            if stream.match("COMMA"):
-                                stream.consume()
-                            elif not stream.match("RPAREN"):
-                                raise SyntaxError("Expected ',' or ')' in method call")
-
-                        stream.expect("RPAREN")
-                        expr = MethodCall(expr, method_name, arguments)
-                    else:
-                        # Attribute access: object.attribute
-                        expr = AttributeAccess(expr, method_name)
-
-                elif stream.match("LPAREN"):
-                    # Function call: function(args)
+        handler = self._PRIMARY_DISPATCH.get(current.type)
+        if handler is None:
+            raise SyntaxError(f"Unexpected token: {current.type} ('{current.value}')")
+        return handler(self, stream, current)
+
+    def _primary_number(self, stream, current):
+        stream.consume()
+        node = _NUM_CACHE.get(current.value)
+        return node if node is not None else NumberLiteral(current.value)
+
+    def _primary_string(self, stream, current):
+        stream.consume()
+        return StringLiteral(current.value)
+
+    def _primary_identifier(self, stream, current):
+        stream.consume()
+        name = current.value
+        expr = _IDENT_CACHE.get(name)
+        if expr is None:
+            expr = Identifier(name)
+            if len(_IDENT_CACHE) < _IDENT_CACHE_MAX:
+                _IDENT_CACHE[name] = expr
+
+        # Handle dot notation and function calls in a loop
+        while True:
+            if stream.match("DOT"):
+                # Handle method call: object.method(args)
+                stream.consume()  # consume .
+                method_token = stream.expect("IDENTIFIER")
+                method_name = method_token.value
+
+                if stream.match("LPAREN"):
+                    # Method call with arguments
                     stream.consume()  # consume (
 
                     arguments = []
@@ -972,52 +1052,82 @@ class TengParser:
                         if stream.match("COMMA"):
                             stream.consume()
                         elif not stream.match("RPAREN"):
-                            raise SyntaxError("Expected ',' or ')' in function call")
+                            raise SyntaxError("Expected ',' or ')' in method call")
 
                     stream.expect("RPAREN")
-                    expr = FunctionCall(
-                        expr.name if isinstance(expr, Identifier) else str(expr),
-                        arguments,
-                    )
+                    expr = MethodCall(expr, method_name, arguments)
                 else:
-                    break
+                    # Attribute access: object.attribute
+                    expr = AttributeAccess(expr, method_name)
 
-            return expr
+            elif stream.match("LPAREN"):
+                # Function call: function(args)
+                stream.consume()  # consume (
 
-        elif current.type == "TELUGU_KEYWORD":
-            # Handle Telugu boolean literals
-            if current.value == "True":  # Nijam
-                stream.consume()
-                return BooleanLiteral(True)
-            elif current.value == "False":  # Abaddam
-                stream.consume()
-                return BooleanLiteral(False)
+                arguments = []
+                while not stream.match("RPAREN"):
+                    arg = self._parse_expression(stream)
+                    arguments.append(arg)
+
+                    if stream.match("COMMA"):
+                        stream.consume()
+                    elif not stream.match("RPAREN"):
+                        raise SyntaxError("Expected ',' or ')' in function call")
+
+                stream.expect("RPAREN")
+                expr = FunctionCall(
+                    expr.name if isinstance(expr, Identifier) else str(expr),
+                    arguments,
+                )
+            else:
+                break
 
-        elif current.type == "LPAREN":
-            stream.consume()  # consume (
-            expr = self._parse_expression(stream)
-            stream.expect("RPAREN")
-            return expr
+        return expr
 
-        elif current.type == "LBRACKET":
-            # List literal
-            stream.consume()  # consume [
+    def _primary_telugu_keyword(self, stream, current):
+        # Handle Telugu boolean literals; other keyword values fall
+        # through to None, as the old elif chain did
+        if current.value == "True":  # Nijam
+            stream.consume()
+            return _TRUE
+        elif current.value == "False":  # Abaddam
+            stream.consume()
+            return _FALSE
+        return None
 
-            elements = []
-            while not stream.match("RBRACKET"):
-                elem = self._parse_expression(stream)
-                elements.append(elem)
+    def _primary_paren(self, stream, current):
+        stream.consume()  # consume (
+        expr = self._parse_expression(stream)
+        stream.expect("RPAREN")
+        return expr
 
-                if stream.match("COMMA"):
-                    stream.consume()
-                elif not stream.match("RBRACKET"):
-                    raise SyntaxError("Expected ',' or ']' in list literal")
+    def _primary_list(self, stream, current):
+        # List literal
+        stream.consume()  # consume [
 
-            stream.expect("RBRACKET")
-            return ListLiteral(elements)
+        elements = []
+        while not stream.match("RBRACKET"):
+            elem = self._parse_expression(stream)
+            elements.append(elem)
 
-        else:
-            raise SyntaxError(f"Unexpected token: {current.type} ('{current.value}')")
+            if stream.match("COMMA"):
+                stream.consume()
+            elif not stream.match("RBRACKET"):
+                raise SyntaxError("Expected ',' or ']' in list literal")
+
+        stream.expect("RBRACKET")
+        return ListLiteral(elements)
+
+    # Primary-expression dispatch by token type, built at class body time
+    # like _TELUGU_DISPATCH: one dict probe replaces the old elif chain.
+    _PRIMARY_DISPATCH = {
+        "NUMBER": _primary_number,
+        "STRING": _primary_string,
+        "IDENTIFIER": _primary_identifier,
+        "TELUGU_KEYWORD": _primary_telugu_keyword,
+        "LPAREN": _primary_paren,
+        "LBRACKET": _primary_list,
+    }
 
 
 def create_parser():
@@ -5,26 +5,121 @@ This module orchestrates the complete transpilation pipeline:
 Telugu/Tenglish code → Lexer → Parser → AST → Python code
 """
 
+import functools
+
 from typing import Optional
 
 try:
     from .lexer import TengLexer
     from .parser import TengParser
-    from .ast_nodes import Program
+    from .ast_nodes import (
+        Program,
+        AssignmentStatement,
+        BinaryOperation,
+        BooleanLiteral,
+        BreakStatement,
+        ContinueStatement,
+        ExpressionStatement,
+        ForStatement,
+        FunctionCall,
+        FunctionDefinition,
+        Identifier,
+        IfStatement,
+        ListLiteral,
+        NumberLiteral,
+        ReturnStatement,
+        UnaryOperation,
+        WhileStatement,
+    )
 except ImportError:
     # Fallback for direct execution
     from lexer import TengLexer
     from parser import TengParser
-    from ast_nodes import Program
+    from ast_nodes import (
+        Program,
+        AssignmentStatement,
+        BinaryOperation,
+        BooleanLiteral,
+        BreakStatement,
+        ContinueStatement,
+        ExpressionStatement,
+        ForStatement,
+        FunctionCall,
+        FunctionDefinition,
+        Identifier,
+        IfStatement,
+        ListLiteral,
+        NumberLiteral,
+        ReturnStatement,
+        UnaryOperation,
+        WhileStatement,
+    )
+
+
+# Built-ins that Numba can compile in nopython mode. A function body that
+# only calls these (and touches no strings) is safe to decorate.
+_NUMBA_SAFE_CALLS = {"range", "len", "int", "float", "abs", "min", "max"}
+
+
+def _is_numba_safe(node) -> bool:
+    """Check whether an AST node only uses numeric-friendly constructs."""
+    if isinstance(node, (NumberLiteral, BooleanLiteral, Identifier)):
+        return True
+    if isinstance(node, BinaryOperation):
+        return _is_numba_safe(node.left) and _is_numba_safe(node.right)
+    if isinstance(node, UnaryOperation):
+        return _is_numba_safe(node.operand)
+    if isinstance(node, FunctionCall):
+        return node.name in _NUMBA_SAFE_CALLS and all(
+            _is_numba_safe(arg) for arg in node.arguments
+        )
+    if isinstance(node, ListLiteral):
+        return all(_is_numba_safe(elem) for elem in node.elements)
+    if isinstance(node, AssignmentStatement):
+        return _is_numba_safe(node.value)
+    if isinstance(node, ExpressionStatement):
+        return _is_numba_safe(node.expression)
+    if isinstance(node, ReturnStatement):
+        return node.value is None or _is_numba_safe(node.value)
+    if isinstance(node, (BreakStatement, ContinueStatement)):
+        return True
+    if isinstance(node, IfStatement):
+        return (
+            _is_numba_safe(node.condition)
+            and all(_is_numba_safe(s) for s in node.then_block)
+            and all(_is_numba_safe(s) for s in node.else_block)
+            and all(
+                _is_numba_safe(e.condition) and all(_is_numba_safe(s) for s in e.body)
+                for e in node.elif_blocks
+            )
+        )
+    if isinstance(node, ForStatement):
+        return _is_numba_safe(node.iterable) and all(
+            _is_numba_safe(s) for s in node.body
+        )
+    if isinstance(node, WhileStatement):
+        return _is_numba_safe(node.condition) and all(
+            _is_numba_safe(s) for s in node.body
+        )
+    # Anything else (strings, prints, method calls, ...) is unsafe
+    return False
 
 
 class TengTranspiler:
     """Main transpiler class that orchestrates the Telugu to Python conversion."""
 
-    def __init__(self):
+    def __init__(self, numba_mode: bool = False):
         self.lexer = TengLexer()
         self.lexer.build()
         self.parser = TengParser()
+        # Opt-in: decorate purely numeric functions with @njit in the
+        # generated code so repeated executions get JIT compiled.
+        self.numba_mode = numba_mode
+        # Small parse cache shared by transpile() and the debug helpers,
+        # so debug mode (which inspects and then transpiles the same
+        # line) lexes and parses it once. Generated Programs are never
+        # mutated downstream, so sharing the AST is safe.
+        self._parse_cached = functools.lru_cache(maxsize=32)(self.parser.parse)
 
     def transpile(self, telugu_code: str) -> str:
         """
@@ -41,18 +136,14 @@ class TengTranspiler:
             ValueError: If transpilation fails for other reasons
         """
         try:
-            # Step 1: Tokenize Telugu code
-            tokens = self.lexer.tokenize(telugu_code)
-
-            # Debug: Filter out None tokens
-            tokens = [t for t in tokens if t is not None]
-
-            # Step 2: Parse tokens into AST
-            ast = self.parser.parse(telugu_code)
+            # Step 1: Parse into an AST (the parser drives its own lexer)
+            ast = self._parse_cached(telugu_code)
 
-            # Step 3: Generate Python code from AST
+            # Step 2: Generate Python code from AST
             if isinstance(ast, Program):
                 python_code = ast.to_python()
+                if self.numba_mode:
+                    python_code = self._apply_numba_decorators(ast, python_code)
                 return python_code
             else:
                 raise ValueError(f"Parser returned unexpected type: {type(ast)}")
@@ -61,6 +152,80 @@ class TengTranspiler:
             # Re-raise with more context
             raise SyntaxError(f"Transpilation failed: {str(e)}") from e
 
+    def _apply_numba_decorators(self, ast: Program, python_code: str) -> str:
+        """Prepend @njit to top-level functions whose bodies are purely numeric."""
+        safe_functions = {
+            stmt.name
+            for stmt in ast.statements
+            if isinstance(stmt, FunctionDefinition)
+            and all(_is_numba_safe(s) for s in stmt.body)
+        }
+        if not safe_functions:
+            return python_code
+
+        lines = []
+        for line in python_code.split("\n"):
+            if line.startswith("def ") and line[4:].split("(")[0] in safe_functions:
+                # No cache=True: the generated code is exec'd from strings
+                # (and -c input has no file at all), so numba would have
+                # no source location to key an on-disk cache by
+                lines.append("@njit")
+            lines.append(line)
+
+        return "from numba import njit\n\n" + "\n".join(lines)
+
+    def transpile_stream(self, telugu_code: str, out_file) -> None:
+        """
+        Transpile Telugu/Tenglish code, writing Python to a file object.
+
+        Each top-level statement is generated and written as soon as it
+        is emitted, so peak memory stays at one statement's worth of
+        generated code instead of the whole program. Output matches
+        transpile() byte for byte.
+
+        Args:
+            telugu_code: Telugu source code as string
+            out_file: Writable text file object for the Python code
+
+        Raises:
+            SyntaxError: If the Telugu code has syntax errors
+        """
+        if self.numba_mode:
+            # Decorator insertion needs the whole program; fall back to
+            # the string path
+            out_file.write(self.transpile(telugu_code))
+            return
+
+        try:
+            ast = self._parse_cached(telugu_code)
+            if not isinstance(ast, Program):
+                raise ValueError(f"Parser returned unexpected type: {type(ast)}")
+
+            # The previous statement's text is held back one step so the
+            # final statement can be right-stripped, matching the
+            # trailing rstrip() in Program.to_python
+            held = None
+            held_sep = False
+            buf: list = []
+            for stmt in ast.statements:
+                del buf[:]
+                stmt.emit(buf, 0)
+                text = "".join(buf)
+                if not text.strip():
+                    continue
+                if held is not None:
+                    out_file.write(held)
+                    if held_sep:
+                        out_file.write("\n")
+                held = text
+                held_sep = stmt._needs_blank_line_after
+            if held is not None:
+                out_file.write(held.rstrip())
+
+        except Exception as e:
+            # Re-raise with more context
+            raise SyntaxError(f"Transpilation failed: {str(e)}") from e
+
     def transpile_file(self, input_file: str, output_file: Optional[str] = None) -> str:
         """
         Transpile a Telugu file to Python.
@@ -116,7 +281,7 @@ class TengTranspiler:
             AST representation
         """
         try:
-            ast = self.parser.parse(telugu_code)
+            ast = self._parse_cached(telugu_code)
             print("AST:")
             print(f"  Type: {type(ast)}")
             print(f"  Repr: {repr(ast)}")
@@ -171,8 +336,14 @@ class TengTranspiler:
         print("=" * 60)
 
 
+@functools.lru_cache(maxsize=1)
 def create_transpiler():
-    """Create and return a new transpiler instance."""
+    """Return a shared TengTranspiler instance.
+
+    Transpilation holds no per-call state on the transpiler, so repeat
+    callers (the REPL, per-script CLI invocations in one process) reuse
+    one lexer/parser pair instead of rebuilding them each time.
+    """
     return TengTranspiler()
 
 
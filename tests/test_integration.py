@@ -576,6 +576,112 @@ class TestTranspilerComponents:
             ast = self.parser.parse("okavela x aite:")
 
 
+class TestTranspileStream:
+    """Test streaming code generation matches the string pipeline."""
+
+    PROGRAMS = [
+        # Empty program
+        "",
+        # Single statement
+        '("Hello World")cheppu',
+        # Function definition followed by statements (blank-line separation)
+        "vidhanam add(a, b):\n" "    a + b ivvu\n" "\n" "x = add(2, 3)\n" "(x)cheppu\n",
+        # Trailing blank lines must not leak into the output
+        'name = "Ravi"\n(name)cheppu\n\n\n',
+        # Program ending in a block statement
+        "i = 0\n" "i < 3 unnanta varaku:\n" "    (i)cheppu\n" "    i = i + 1\n",
+        # Conditionals with elif/else
+        "x = 10\n"
+        "okavela x > 5 aite:\n"
+        '    ("big")cheppu\n'
+        "lekapothe:\n"
+        '    ("small")cheppu\n',
+    ]
+
+    def setup_method(self):
+        """Set up transpiler for each test."""
+        if TengTranspiler:
+            self.transpiler = TengTranspiler()
+        else:
+            self.transpiler = None
+
+    def test_stream_matches_transpile(self):
+        """transpile_stream output is byte-identical to transpile()."""
+        if not self.transpiler:
+            pytest.skip("Transpiler not implemented yet - TDD phase")
+
+        import io
+
+        for telugu_code in self.PROGRAMS:
+            expected = self.transpiler.transpile(telugu_code)
+            out = io.StringIO()
+            self.transpiler.transpile_stream(telugu_code, out)
+            assert out.getvalue() == expected, telugu_code
+
+
+class TestNumbaMode:
+    """Test opt-in @njit decoration of purely numeric functions."""
+
+    def setup_method(self):
+        """Set up a numba-mode transpiler for each test."""
+        if TengTranspiler:
+            self.transpiler = TengTranspiler(numba_mode=True)
+        else:
+            self.transpiler = None
+
+    def test_numeric_function_is_decorated(self):
+        """A purely numeric function body gets @njit and the import."""
+        if not self.transpiler:
+            pytest.skip("Transpiler not implemented yet - TDD phase")
+
+        telugu_code = "vidhanam add(a, b):\n    a + b ivvu\n"
+        result = self.transpiler.transpile(telugu_code)
+
+        assert result.startswith("from numba import njit")
+        assert "@njit\ndef add(a, b):" in result
+
+    def test_string_body_is_excluded(self):
+        """Functions touching strings are left undecorated."""
+        if not self.transpiler:
+            pytest.skip("Transpiler not implemented yet - TDD phase")
+
+        telugu_code = 'vidhanam greet():\n    "hello" ivvu\n'
+        result = self.transpiler.transpile(telugu_code)
+
+        assert "njit" not in result
+        assert "def greet():" in result
+
+    def test_print_body_is_excluded(self):
+        """Functions that print are left undecorated."""
+        if not self.transpiler:
+            pytest.skip("Transpiler not implemented yet - TDD phase")
+
+        telugu_code = "vidhanam show(x):\n    (x)cheppu\n"
+        result = self.transpiler.transpile(telugu_code)
+
+        assert "njit" not in result
+
+    def test_method_call_body_is_excluded(self):
+        """Functions calling methods are left undecorated."""
+        if not self.transpiler:
+            pytest.skip("Transpiler not implemented yet - TDD phase")
+
+        telugu_code = "vidhanam grow(items, x):\n    items.append(x)\n    items ivvu\n"
+        result = self.transpiler.transpile(telugu_code)
+
+        assert "njit" not in result
+
+    def test_default_mode_never_decorates(self):
+        """Without numba_mode, numeric functions stay plain."""
+        if not TengTranspiler:
+            pytest.skip("Transpiler not implemented yet - TDD phase")
+
+        telugu_code = "vidhanam add(a, b):\n    a + b ivvu\n"
+        result = TengTranspiler().transpile(telugu_code)
+
+        assert "njit" not in result
+
+
 class TestPerformance:
     """Test performance characteristics of transpiler."""
 
@@ -0,0 +1,92 @@
+"""
+Tests for the CLI caching helpers in main.py.
+
+Covers the marshalled code-object cache (round-trip, wrong interpreter
+magic, corrupt blobs) and the transpile-cache keying.
+"""
+
+import importlib.util
+import sys
+import os
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import main
+from main import _cache_path, _load_code_object, _read_cache, _write_cache
+
+
+class TestCodeObjectCache:
+    """Test the marshalled code-object cache next to the source cache."""
+
+    def test_round_trip(self, tmp_path):
+        """A compiled code object is marshalled and reloaded on the next call."""
+        cache_file = tmp_path / "entry.py"
+        blob_file = cache_file.with_suffix(".marshal")
+
+        code_obj = _load_code_object(cache_file, "x = 2 + 3", None)
+        namespace = {}
+        exec(code_obj, namespace)
+        assert namespace["x"] == 5
+
+        # The blob was written with the interpreter magic prefixed
+        magic = importlib.util.MAGIC_NUMBER
+        assert blob_file.read_bytes()[: len(magic)] == magic
+
+        # Second call loads the blob: passing invalid source proves the
+        # cached code object is used instead of recompiling
+        cached = _load_code_object(cache_file, "this is not python", None)
+        namespace = {}
+        exec(cached, namespace)
+        assert namespace["x"] == 5
+
+    def test_wrong_magic_recompiles(self, tmp_path):
+        """A blob from a different interpreter version is ignored."""
+        cache_file = tmp_path / "entry.py"
+        blob_file = cache_file.with_suffix(".marshal")
+        blob_file.write_bytes(b"BAD0" + b"\x00" * 16)
+
+        code_obj = _load_code_object(cache_file, "x = 1", None)
+        namespace = {}
+        exec(code_obj, namespace)
+        assert namespace["x"] == 1
+
+        # The stale blob was replaced with a loadable one
+        magic = importlib.util.MAGIC_NUMBER
+        assert blob_file.read_bytes()[: len(magic)] == magic
+
+    def test_truncated_blob_recompiles(self, tmp_path):
+        """A corrupt/truncated marshal payload falls back to compile."""
+        cache_file = tmp_path / "entry.py"
+        blob_file = cache_file.with_suffix(".marshal")
+        # Correct magic but an empty payload -> marshal.loads raises
+        blob_file.write_bytes(importlib.util.MAGIC_NUMBER)
+
+        code_obj = _load_code_object(cache_file, "x = 7", None)
+        namespace = {}
+        exec(code_obj, namespace)
+        assert namespace["x"] == 7
+
+
+class TestTranspileCacheKey:
+    """Test the source-text cache keying and read/write helpers."""
+
+    def test_hit_after_write(self, tmp_path):
+        cache_file = tmp_path / "entry.py"
+        _write_cache(cache_file, "print('cached')")
+        assert _read_cache(cache_file) == "print('cached')"
+
+    def test_miss_returns_none(self, tmp_path):
+        assert _read_cache(tmp_path / "absent.py") is None
+
+    def test_key_varies_by_source_and_options(self):
+        base = _cache_path("(1)cheppu", False)
+        assert _cache_path("(1)cheppu", False) == base
+        assert _cache_path("(2)cheppu", False) != base
+        assert _cache_path("(1)cheppu", True) != base
+
+    def test_key_varies_by_transpiler_version(self, monkeypatch):
+        """A transpiler upgrade must not serve previously cached output."""
+        before = _cache_path("(1)cheppu", False)
+        monkeypatch.setattr(main, "_TRANSPILER_STAMP", b"other-version")
+        assert _cache_path("(1)cheppu", False) != before